@@ -17,6 +17,21 @@ HUE_LIGHT_EFFECT_CLUSTER_ID = 0xFC03
 HUE_VENDOR_ID = 0x100B
 
 _uint16 = struct.Struct("<H")
+# Gradient colors header: size, color count << 4, style, and 2 reserved bytes.
+_gradient_header = struct.Struct("<BBBxx")
+
+# Encoded form of a HueLightUpdateMessage with no fields set (flags only).
+_EMPTY_MESSAGE = b"\x00\x00"
+
+
+def _scale(value: float, maximum: float) -> int:
+    """Convert a 0-1 color coordinate to a 12-bit value, where 0xFFF is `maximum`."""
+    return int(0xFFF * max(0, min(value / maximum, 1)))
+
+
+def _unscale(value: int, maximum: float) -> float:
+    """Convert a 12-bit color coordinate back to 0-1, where 0xFFF is `maximum`."""
+    return value / 0xFFF * maximum
 
 
 class _Flags(enum.IntFlag):
@@ -33,6 +48,19 @@ class _Flags(enum.IntFlag):
     GRADIENT_COLORS = 1 << 8
 
 
+# Plain int copies of the flags. Operators on IntFlag members are implemented in
+# Python and allocate a new member, which is slow in the encoding hot path.
+_F_ON_OFF = _Flags.ON_OFF.value
+_F_BRIGHTNESS = _Flags.BRIGHTNESS.value
+_F_COLOR_MIRED = _Flags.COLOR_MIRED.value
+_F_COLOR_XY = _Flags.COLOR_XY.value
+_F_TRANSITION_TIME = _Flags.TRANSITION_TIME.value
+_F_EFFECT = _Flags.EFFECT.value
+_F_GRADIENT_PARAMS = _Flags.GRADIENT_PARAMS.value
+_F_EFFECT_SPEED = _Flags.EFFECT_SPEED.value
+_F_GRADIENT_COLORS = _Flags.GRADIENT_COLORS.value
+
+
 class HueLightEffect(enum.IntEnum):
     """Predefined effects supported by Hue lights."""
 
@@ -50,7 +78,7 @@ class HueLightEffect(enum.IntEnum):
     ENCHANT = 0x11
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HueLightColorXYScaled:
     """
     Color specified as XY coordinates.
@@ -68,16 +96,11 @@ class HueLightColorXYScaled:
 
     def to_bytes(self) -> bytes:
         """Serialize to a 3-byte byte string."""
-        return bytes(
-            (
-                self.x & 0x0FF,
-                (self.x & 0xF00) >> 8 | (self.y & 0x00F) << 4,
-                (self.y & 0xFF0) >> 4,
-            ),
-        )
+        # X occupies the low 12 bits and Y the high 12 bits of a little-endian uint24.
+        return ((self.x & 0xFFF) | (self.y & 0xFFF) << 12).to_bytes(3, "little")
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> HueLightColorXYScaled:
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> HueLightColorXYScaled:
         """Deserialize from a 3-byte byte string."""
         if len(data) != 3:
             raise ValueError(f"Expected 3 bytes, received {len(data)}")
@@ -87,7 +110,7 @@ class HueLightColorXYScaled:
         return cls(x=x, y=y)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HueLightColorXY:
     """
     Color specified as XY coordinates in the range 0-1.
@@ -101,20 +124,69 @@ class HueLightColorXY:
     def to_scaled(self) -> HueLightColorXYScaled:
         """Convert from 0-1 to a scaled representation for serialization."""
         return HueLightColorXYScaled(
-            x=int(0xFFF * max(0, min(self.x / HueLightColorXYScaled.SCALING_MAX_X, 1))),
-            y=int(0xFFF * max(0, min(self.y / HueLightColorXYScaled.SCALING_MAX_Y, 1))),
+            x=_scale(self.x, HueLightColorXYScaled.SCALING_MAX_X),
+            y=_scale(self.y, HueLightColorXYScaled.SCALING_MAX_Y),
         )
 
     @classmethod
     def from_scaled(cls, scaled: HueLightColorXYScaled) -> HueLightColorXY:
         """Convert from a scaled representation to 0-1."""
         return cls(
-            x=scaled.x / 0xFFF * HueLightColorXYScaled.SCALING_MAX_X,
-            y=scaled.y / 0xFFF * HueLightColorXYScaled.SCALING_MAX_Y,
+            x=_unscale(scaled.x, HueLightColorXYScaled.SCALING_MAX_X),
+            y=_unscale(scaled.y, HueLightColorXYScaled.SCALING_MAX_Y),
+        )
+
+
+def _append_scaled_colors(result: bytearray, colors: list[HueLightColorXY]) -> None:
+    """
+    Append the scaled 3-byte representation of each color to `result`.
+
+    Equivalent to `result += color.to_scaled().to_bytes()` for each color, without
+    allocating intermediate objects.
+    """
+    max_x = HueLightColorXYScaled.SCALING_MAX_X
+    max_y = HueLightColorXYScaled.SCALING_MAX_Y
+    # Each color is a 24-bit little-endian value (see HueLightColorXYScaled), so
+    # all colors can be accumulated into one integer and converted in one call.
+    packed = 0
+    shift = 0
+    for color in colors:
+        # Same formula as _scale, inlined to avoid two calls per color.
+        x = int(0xFFF * max(0, min(color.x / max_x, 1)))
+        y = int(0xFFF * max(0, min(color.y / max_y, 1)))
+        packed |= (x | y << 12) << shift
+        shift += 24
+    result += packed.to_bytes(3 * len(colors), "little")
+
+
+def _unpack_scaled_colors(
+    data: bytes | bytearray | memoryview,
+    start: int,
+    end: int,
+) -> list[HueLightColorXY]:
+    """
+    Read scaled 3-byte colors from `data[start:end]`.
+
+    Equivalent to `HueLightColorXY.from_scaled(HueLightColorXYScaled.from_bytes(...))`
+    for each color, without copying `data` or allocating intermediate objects.
+    """
+    max_x = HueLightColorXYScaled.SCALING_MAX_X
+    max_y = HueLightColorXYScaled.SCALING_MAX_Y
+    packed = int.from_bytes(memoryview(data)[start:end], "little")
+    colors: list[HueLightColorXY] = []
+    for shift in range(0, 8 * (end - start), 24):
+        color = packed >> shift
+        colors.append(
+            HueLightColorXY(
+                # Same formula as _unscale, inlined to avoid two calls per color.
+                x=(color & 0xFFF) / 0xFFF * max_x,
+                y=(color >> 12 & 0xFFF) / 0xFFF * max_y,
+            ),
         )
+    return colors
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HueLightColorMired:
     """Color temperature specified in mireds."""
 
@@ -134,7 +206,7 @@ class HueLightGradientStyle(enum.IntEnum):
     MIRRORED = 0x04
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HueLightGradient:
     """A custom gradient on a light strip."""
 
@@ -142,7 +214,7 @@ class HueLightGradient:
     colors: list[HueLightColorXY]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HueLightGradientParams:
     """
     Gradient scale and offset parameters (for light strips).
@@ -162,7 +234,7 @@ class HueLightGradientParams:
     offset: float
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HueLightUpdateMessage:
     """
     A combined light state update message.
@@ -210,85 +282,122 @@ class HueLightUpdateMessage:
     gradient: HueLightGradient | None = None
     gradient_params: HueLightGradientParams | None = None
 
-    def to_bytes(self) -> bytes:
+    def to_bytes(self) -> bytes:  # noqa: PLR0912, PLR0915
         """Serialize a HueLightUpdateMessage to a byte string."""
-        result = bytearray()
-        flags = _Flags(0)
+        # Field encoding is kept inline (rather than split into helper functions)
+        # because per-call overhead dominates for messages this small.
+        #
+        # Fast path for empty messages, which need no buffer or flag handling.
+        if (
+            self.is_on is None  # noqa: PLR0916
+            and self.brightness is None
+            and self.color_temp is None
+            and self.color_xy is None
+            and self.transition_time is None
+            and self.effect is None
+            and self.gradient is None
+            and self.effect_speed is None
+            and self.gradient_params is None
+        ):
+            return _EMPTY_MESSAGE
+        # Reserve space for the flags, which are filled in once all fields are known.
+        result = bytearray(_uint16.size)
+        flags = 0
         if self.is_on is not None:
-            flags |= _Flags.ON_OFF
+            flags |= _F_ON_OFF
             result.append(1 if self.is_on else 0)
         if self.brightness is not None:
             if not (1 <= self.brightness <= 254):
                 raise ValueError("Brightness must be between 1 and 254")
-            flags |= _Flags.BRIGHTNESS
+            flags |= _F_BRIGHTNESS
             result.append(self.brightness)
+        # uint16 fields are appended as little-endian byte pairs.
         if self.color_temp is not None:
-            flags |= _Flags.COLOR_MIRED
-            result += _uint16.pack(self.color_temp.mired)
-        if self.color_xy is not None:
-            flags |= _Flags.COLOR_XY
-            result += _uint16.pack(int(self.color_xy.x * 0xFFFF))
-            result += _uint16.pack(int(self.color_xy.y * 0xFFFF))
+            mired = self.color_temp.mired
+            if not (0 <= mired <= 0xFFFF):
+                raise ValueError("Color temperature must be between 0 and 65535")
+            flags |= _F_COLOR_MIRED
+            result.append(mired & 0xFF)
+            result.append(mired >> 8)
+        color_xy = self.color_xy
+        if color_xy is not None:
+            flags |= _F_COLOR_XY
+            # Round to the nearest step (halves round up) and clamp to 0-0xFFFF.
+            x = min(0xFFFF, int(max(0, color_xy.x * 0xFFFF) + 0.5))
+            y = min(0xFFFF, int(max(0, color_xy.y * 0xFFFF) + 0.5))
+            result.append(x & 0xFF)
+            result.append(x >> 8)
+            result.append(y & 0xFF)
+            result.append(y >> 8)
         if self.transition_time is not None:
-            flags |= _Flags.TRANSITION_TIME
-            result += _uint16.pack(self.transition_time)
+            transition_time = self.transition_time
+            if not (0 <= transition_time <= 0xFFFF):
+                raise ValueError("Transition time must be between 0 and 65535")
+            flags |= _F_TRANSITION_TIME
+            result.append(transition_time & 0xFF)
+            result.append(transition_time >> 8)
         if self.effect is not None:
-            flags |= _Flags.EFFECT
-            result.append(self.effect.value)
-        if self.gradient is not None:
-            flags |= _Flags.GRADIENT_COLORS
-            size = 4 + 3 * len(self.gradient.colors)
-            result.extend(
-                (
-                    size,
-                    len(self.gradient.colors) << 4,
-                    self.gradient.style.value,
-                    0,
-                    0,
-                ),
+            flags |= _F_EFFECT
+            # IntEnum members are ints, so they can be written without the
+            # comparatively slow .value descriptor lookup.
+            result.append(self.effect)
+        gradient = self.gradient
+        if gradient is not None:
+            flags |= _F_GRADIENT_COLORS
+            colors = gradient.colors
+            color_count = len(colors)
+            if color_count > 15:
+                raise ValueError("Gradient must have at most 15 colors")
+            result += _gradient_header.pack(
+                4 + 3 * color_count,
+                color_count << 4,
+                gradient.style,
             )
-            for color in self.gradient.colors:
-                result += color.to_scaled().to_bytes()
+            _append_scaled_colors(result, colors)
         if self.effect_speed is not None:
-            flags |= _Flags.EFFECT_SPEED
+            flags |= _F_EFFECT_SPEED
             result.append(self.effect_speed)
-        if self.gradient_params is not None:
-            flags |= _Flags.GRADIENT_PARAMS
-            result.append(int(self.gradient_params.scale * 8))
-            result.append(int(self.gradient_params.offset * 8))
+        gradient_params = self.gradient_params
+        if gradient_params is not None:
+            flags |= _F_GRADIENT_PARAMS
+            # Round to the nearest 1/8 (halves round up) and clamp to the encodable
+            # range (0-31.875).
+            result.append(min(255, int(max(0, gradient_params.scale * 8) + 0.5)))
+            result.append(min(255, int(max(0, gradient_params.offset * 8) + 0.5)))
 
-        return _uint16.pack(flags) + result
+        _uint16.pack_into(result, 0, flags)
+        return bytes(result)
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> HueLightUpdateMessage:
-        """Deserialize a HueLightUpdateMessage from a byte string."""
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> HueLightUpdateMessage:
+        """Deserialize a HueLightUpdateMessage from a byte string or buffer."""
         result = HueLightUpdateMessage()
-        flags = _Flags(_uint16.unpack_from(data, 0)[0])
+        flags = _uint16.unpack_from(data, 0)[0]
         offset = _uint16.size
-        if _Flags.ON_OFF in flags:
+        if flags & _F_ON_OFF:
             result.is_on = data[offset] != 0
             offset += 1
-        if _Flags.BRIGHTNESS in flags:
+        if flags & _F_BRIGHTNESS:
             result.brightness = data[offset]
             offset += 1
-        if _Flags.COLOR_MIRED in flags:
+        if flags & _F_COLOR_MIRED:
             result.color_temp = HueLightColorMired(
                 mired=_uint16.unpack_from(data, offset)[0],
             )
             offset += _uint16.size
-        if _Flags.COLOR_XY in flags:
+        if flags & _F_COLOR_XY:
             result.color_xy = HueLightColorXY(
                 x=_uint16.unpack_from(data, offset)[0] / 0xFFFF,
                 y=_uint16.unpack_from(data, offset + _uint16.size)[0] / 0xFFFF,
             )
             offset += 2 * _uint16.size
-        if _Flags.TRANSITION_TIME in flags:
+        if flags & _F_TRANSITION_TIME:
             result.transition_time = _uint16.unpack_from(data, offset)[0]
             offset += _uint16.size
-        if _Flags.EFFECT in flags:
+        if flags & _F_EFFECT:
             result.effect = HueLightEffect(data[offset])
             offset += 1
-        if _Flags.GRADIENT_COLORS in flags:
+        if flags & _F_GRADIENT_COLORS:
             size = data[offset]
             if size < 4:
                 raise ValueError(
@@ -303,7 +412,6 @@ class HueLightUpdateMessage:
             color_count = data[offset + 1] >> 4
             style = HueLightGradientStyle(data[offset + 2])
             # offset + 3 and offset + 4 are reserved
-            colors: list[HueLightColorXY] = []
             colors_start = offset + 5
             colors_end = colors_start + color_count * 3
             if colors_end > offset + size + 1:
@@ -312,20 +420,13 @@ class HueLightUpdateMessage:
                     f"colors would extend {colors_end - offset} bytes beyond "
                     f"offset={offset}, expected no more than size={size})",
                 )
-            colors.extend(
-                HueLightColorXY.from_scaled(
-                    HueLightColorXYScaled.from_bytes(
-                        data[color_offset : color_offset + 3],
-                    ),
-                )
-                for color_offset in range(colors_start, colors_end, 3)
-            )
+            colors = _unpack_scaled_colors(data, colors_start, colors_end)
             result.gradient = HueLightGradient(style=style, colors=colors)
             offset += size + 1
-        if _Flags.EFFECT_SPEED in flags:
+        if flags & _F_EFFECT_SPEED:
             result.effect_speed = data[offset]
             offset += 1
-        if _Flags.GRADIENT_PARAMS in flags:
+        if flags & _F_GRADIENT_PARAMS:
             result.gradient_params = HueLightGradientParams(
                 scale=data[offset] / 8,
                 offset=data[offset + 1] / 8,
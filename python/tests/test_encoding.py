@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 
 from hue_zigbee_encoding import (
@@ -137,3 +139,133 @@ def test_examples(data: bytes, expected_message: HueLightUpdateMessage):
 
     assert HueLightUpdateMessage.from_bytes(data) == expected_message
     assert expected_message.to_bytes() == data
+
+
+@pytest.mark.parametrize(
+    ("message", "expected_error"),
+    [
+        (
+            HueLightUpdateMessage(color_temp=HueLightColorMired(mired=-1)),
+            "Color temperature must be between 0 and 65535",
+        ),
+        (
+            HueLightUpdateMessage(color_temp=HueLightColorMired(mired=0x10000)),
+            "Color temperature must be between 0 and 65535",
+        ),
+        (
+            HueLightUpdateMessage(transition_time=-1),
+            "Transition time must be between 0 and 65535",
+        ),
+        (
+            HueLightUpdateMessage(transition_time=0x10000),
+            "Transition time must be between 0 and 65535",
+        ),
+    ],
+)
+def test_encoding_uint16_out_of_range(
+    message: HueLightUpdateMessage,
+    expected_error: str,
+):
+    with pytest.raises(ValueError, match=expected_error):
+        message.to_bytes()
+
+
+def test_encoding_gradient_colors_match_scaled():
+    colors = [HueLightColorXY(x=i / 10 - 0.2, y=1.2 - i / 10) for i in range(15)]
+    message = HueLightUpdateMessage(
+        gradient=HueLightGradient(style=HueLightGradientStyle.LINEAR, colors=colors),
+    )
+    expected_colors = b"".join(color.to_scaled().to_bytes() for color in colors)
+    assert message.to_bytes()[7:] == expected_colors
+
+
+@pytest.mark.parametrize(
+    ("params", "expected_bytes"),
+    [
+        (HueLightGradientParams(scale=1.99 / 8, offset=2.01 / 8), b"\x02\x02"),
+        (HueLightGradientParams(scale=-1, offset=32), b"\x00\xff"),
+        (HueLightGradientParams(scale=2.5 / 8, offset=3.5 / 8), b"\x03\x04"),
+    ],
+)
+def test_encoding_gradient_params_rounding(
+    params: HueLightGradientParams,
+    expected_bytes: bytes,
+):
+    message = HueLightUpdateMessage(gradient_params=params)
+    assert message.to_bytes() == b"\x40\x00" + expected_bytes
+
+
+def test_encoding_empty_message_after_clearing_fields():
+    message = HueLightUpdateMessage(is_on=True, brightness=0x7F)
+    message.is_on = None
+    message.brightness = None
+    assert message.to_bytes() == b"\x00\x00"
+
+
+_FULL_MESSAGE = HueLightUpdateMessage(
+    is_on=True,
+    brightness=0x7F,
+    color_temp=HueLightColorMired(mired=0x1234),
+    color_xy=HueLightColorXY(x=0.5, y=0.5),
+    transition_time=0x1234,
+    effect=HueLightEffect.SUNSET,
+    effect_speed=0x12,
+    gradient=HueLightGradient(style=HueLightGradientStyle.SCATTERED, colors=[]),
+    gradient_params=HueLightGradientParams(scale=1, offset=2),
+)
+
+
+@pytest.mark.parametrize(
+    "field",
+    [field.name for field in dataclasses.fields(HueLightUpdateMessage)],
+)
+def test_encoding_single_field_is_not_empty(field: str):
+    value = getattr(_FULL_MESSAGE, field)
+    assert value is not None, f"_FULL_MESSAGE needs a value for {field}"
+    message = HueLightUpdateMessage(**{field: value})
+    assert message.to_bytes() != b"\x00\x00"
+
+
+@pytest.mark.parametrize(
+    ("color", "expected_bytes"),
+    [
+        (HueLightColorXY(x=0.99999 / 0xFFFF, y=1.00001 / 0xFFFF), b"\x01\x00\x01\x00"),
+        (HueLightColorXY(x=-0.5, y=1.5), b"\x00\x00\xff\xff"),
+        (HueLightColorXY(x=0.5 / 0xFFFF, y=1.5 / 0xFFFF), b"\x01\x00\x02\x00"),
+    ],
+)
+def test_encoding_xy_rounding(color: HueLightColorXY, expected_bytes: bytes):
+    message = HueLightUpdateMessage(color_xy=color)
+    assert message.to_bytes() == b"\x08\x00" + expected_bytes
+
+
+def test_decoding_buffer_types():
+    message = HueLightUpdateMessage(
+        is_on=True,
+        color_xy=HueLightColorXY(x=0x6677 / 0xFFFF, y=0x2233 / 0xFFFF),
+        gradient=HueLightGradient(
+            style=HueLightGradientStyle.MIRRORED,
+            colors=[
+                HueLightColorXY.from_scaled(HueLightColorXYScaled(x=0x123, y=0xABC)),
+                HueLightColorXY.from_scaled(HueLightColorXYScaled(x=0x789, y=0xDEF)),
+            ],
+        ),
+        effect_speed=0x12,
+    )
+    data = message.to_bytes()
+    assert HueLightUpdateMessage.from_bytes(bytearray(data)) == message
+    assert HueLightUpdateMessage.from_bytes(memoryview(b"\xff" + data)[1:]) == message
+    assert HueLightColorXYScaled.from_bytes(memoryview(data)[12:15]) == (
+        HueLightColorXYScaled(x=0x123, y=0xABC)
+    )
+
+
+def test_encoding_gradient_too_many_colors():
+    message = HueLightUpdateMessage(
+        gradient=HueLightGradient(
+            style=HueLightGradientStyle.LINEAR,
+            colors=[HueLightColorXY(x=0.5, y=0.5)] * 16,
+        ),
+    )
+    with pytest.raises(ValueError, match="Gradient must have at most 15 colors"):
+        message.to_bytes()
@@ -296,8 +296,11 @@ export class HueLightUpdateMessage {
     }
     if (colorXY != undefined) {
       flags |= Flags.COLOR_XY;
-      view.setUint16(offset, colorXY.x * 0xffff, true);
-      view.setUint16(offset + 2, colorXY.y * 0xffff, true);
+      // Round to the nearest step (halves round up) and clamp to 0-0xFFFF.
+      const x = Math.min(0xffff, Math.floor(Math.max(0, colorXY.x * 0xffff) + 0.5));
+      const y = Math.min(0xffff, Math.floor(Math.max(0, colorXY.y * 0xffff) + 0.5));
+      view.setUint16(offset, x, true);
+      view.setUint16(offset + 2, y, true);
       offset += 4;
     }
     if (transitionTime != undefined) {
@@ -311,6 +314,9 @@ export class HueLightUpdateMessage {
       offset += 1;
     }
     if (gradient != undefined) {
+      if (gradient.colors.length > 15) {
+        throw new RangeError("Gradient must have at most 15 colors");
+      }
       flags |= Flags.GRADIENT_COLORS;
       const size = 4 + 3 * gradient.colors.length;
       view.setUint8(offset, size);
@@ -332,8 +338,12 @@ export class HueLightUpdateMessage {
     }
     if (gradientParams != undefined) {
       flags |= Flags.GRADIENT_PARAMS;
-      view.setUint8(offset, gradientParams.scale * 8);
-      view.setUint8(offset + 1, gradientParams.offset * 8);
+      // Round to the nearest 1/8 (halves round up) and clamp to the encodable
+      // range (0-31.875).
+      const scaleByte = Math.min(255, Math.floor(Math.max(0, gradientParams.scale * 8) + 0.5));
+      const offsetByte = Math.min(255, Math.floor(Math.max(0, gradientParams.offset * 8) + 0.5));
+      view.setUint8(offset, scaleByte);
+      view.setUint8(offset + 1, offsetByte);
       offset += 2;
     }
 
@@ -128,6 +128,34 @@ describe("HueLightUpdateMessage encoding", () => {
     expect(HueLightUpdateMessage.fromBytes(expectedBytes)).toEqual(message);
   });
 
+  it.each([
+    [{ scale: 1.99 / 8, offset: 2.01 / 8 }, "\x02\x02"],
+    [{ scale: -1, offset: 32 }, "\x00\xff"],
+    [{ scale: 2.5 / 8, offset: 3.5 / 8 }, "\x03\x04"],
+  ])("rounds and clamps gradient params: %o", (gradientParams, expectedStr) => {
+    const message = new HueLightUpdateMessage({ gradientParams });
+    expect(message.toBytes()).toEqual(binaryStringToBytes("\x40\x00" + expectedStr));
+  });
+
+  it.each([
+    [{ x: 0.99999 / 0xffff, y: 1.00001 / 0xffff }, "\x01\x00\x01\x00"],
+    [{ x: -0.5, y: 1.5 }, "\x00\x00\xff\xff"],
+    [{ x: 0.5 / 0xffff, y: 1.5 / 0xffff }, "\x01\x00\x02\x00"],
+  ])("rounds and clamps XY colors: %o", (xy, expectedStr) => {
+    const message = new HueLightUpdateMessage({ colorXY: new HueLightColorXY(xy) });
+    expect(message.toBytes()).toEqual(binaryStringToBytes("\x08\x00" + expectedStr));
+  });
+
+  it("rejects gradients with more than 15 colors", () => {
+    const message = new HueLightUpdateMessage({
+      gradient: {
+        style: HueLightGradientStyle.LINEAR,
+        colors: Array.from({ length: 16 }, () => new HueLightColorXY({ x: 0.5, y: 0.5 })),
+      },
+    });
+    expect(() => message.toBytes()).toThrow("Gradient must have at most 15 colors");
+  });
+
   // Test some examples from https://github.com/chrivers/bifrost/blob/master/doc/hue-zigbee-format.md
   it.each([
     [